@@ -1,10 +1,17 @@
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, String, Text, ForeignKey, JSON, Integer
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Column, DateTime, String, Text, ForeignKey, JSON, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 from .base import Base
 
+class EmbeddingCache(Base):
+    """SQLAlchemy model caching embeddings by content hash to avoid re-embedding duplicate texts"""
+    __tablename__ = 'embedding_cache'
+
+    content_hash = Column(String(64), primary_key=True)  # SHA-256 hex digest of the embedded text
+    embedding = Column(HALFVEC(384), nullable=False)
+
 class SQLQuery(Base):
     """SQLAlchemy model for storing SQL queries with project separation"""
     __tablename__ = 'sql_queries'
@@ -13,9 +20,9 @@ class SQLQuery(Base):
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=False, index=True)
     question = Column(Text, nullable=False)
     sql = Column(Text, nullable=False)
-    embedding = Column(Vector(384), nullable=False)  # Will be populated by vector service
+    embedding = Column(HALFVEC(384), nullable=False)  # Will be populated by vector service
     sql_metadata = Column(JSON, nullable=True)  # JSON object for metadata
-    created_at = Column(Integer)  # Unix timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship
     project = relationship("Project", back_populates="sql_queries")
@@ -27,9 +34,9 @@ class DDLStatement(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=False, index=True)
     ddl = Column(Text, nullable=False)
-    embedding = Column(Vector(384), nullable=False)  # Will be populated by vector service
+    embedding = Column(HALFVEC(384), nullable=False)  # Will be populated by vector service
     ddl_metadata = Column(JSON, nullable=True)  # JSON object for metadata
-    created_at = Column(Integer)  # Unix timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship
     project = relationship("Project", back_populates="ddl_statements")
@@ -41,9 +48,9 @@ class DocumentationItem(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'), nullable=False, index=True)
     documentation = Column(Text, nullable=False)
-    embedding = Column(Vector(384), nullable=False)  # Will be populated by vector service
+    embedding = Column(HALFVEC(384), nullable=False)  # Will be populated by vector service
     documentation_metadata = Column(JSON, nullable=True)  # JSON object for metadata
-    created_at = Column(Integer)  # Unix timestamp
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship
     project = relationship("Project", back_populates="documentation_items")
\ No newline at end of file
@@ -38,21 +38,18 @@ class ChatService:
         
         print(f"🔍 Generating SQL for query: '{query.text}' in project {project.id}")
         
-        # Get similar content from vector store
-        print(f"📚 Fetching related documentation from vector store for project {project.id}...")
-        similar_docs = VectorService.get_related_documentation(query.text, project_id=str(project.id))
+        # Get similar content from vector store (one parallel retrieval call)
+        print(f"📚 Fetching context from vector store for project {project.id}...")
+        context = VectorService.get_all_context(query.text, project_id=str(project.id))
+        similar_docs = context["doc"]
+        similar_schema = context["ddl"]
+        similar_queries = context["sql"]
         print(f"📄 Found {len(similar_docs) if similar_docs else 0} related documentation items")
         if similar_docs:
             print(f"   Documentation preview: {str(similar_docs)[:200]}...")
-        
-        print(f"🏗️  Fetching related DDL from vector store for project {project.id}...")
-        similar_schema = VectorService.get_related_ddl(query.text, project_id=str(project.id))
         print(f"📋 Found {len(similar_schema) if similar_schema else 0} related DDL items")
         if similar_schema:
             print(f"   DDL preview: {str(similar_schema)[:200]}...")
-        
-        print(f"❓ Fetching similar question-SQL pairs from vector store for project {project.id}...")
-        similar_queries = VectorService.get_similar_question_sql(query.text, project_id=str(project.id))
         print(f"🔗 Found {len(similar_queries) if similar_queries else 0} similar question-SQL pairs")
         if similar_queries:
             print(f"   Similar queries preview: {str(similar_queries)[:200]}...")
@@ -124,16 +121,13 @@ class ChatService:
         
         print(f"🔄 Regenerating SQL for incorrect query: '{query_text}' in project {project.id}")
         
-        print(f"📚 Fetching related documentation for regeneration...")
-        similar_docs = VectorService.get_related_documentation(query_text, project_id=str(project.id))
+        print(f"📚 Fetching context for regeneration...")
+        context = VectorService.get_all_context(query_text, project_id=str(project.id))
+        similar_docs = context["doc"]
+        similar_ddl = context["ddl"]
+        similar_queries = context["sql"]
         print(f"📄 Found {len(similar_docs) if similar_docs else 0} related documentation items for regeneration")
-        
-        print(f"🏗️  Fetching related DDL for regeneration...")
-        similar_ddl = VectorService.get_related_ddl(query_text, project_id=str(project.id))
         print(f"📋 Found {len(similar_ddl) if similar_ddl else 0} related DDL items for regeneration")
-        
-        print(f"❓ Fetching similar question-SQL pairs for regeneration...")
-        similar_queries = VectorService.get_similar_question_sql(query_text, project_id=str(project.id))
         print(f"🔗 Found {len(similar_queries) if similar_queries else 0} similar question-SQL pairs for regeneration")
         
         # Extract sample queries from similar results
@@ -1,6 +1,7 @@
 import boto3
 import json
 import os
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from dotenv import load_dotenv
@@ -10,6 +11,15 @@ load_dotenv()
 AWS_BEARER_TOKEN_BEDROCK = os.getenv("AWS_BEARER_TOKEN_BEDROCK")
 AWS_BEDROCK_REGION = os.getenv("AWS_BEDROCK_REGION")
 
+# Shared HTTP settings: keep-alive + a pooled connection cache so repeated
+# calls reuse existing TCP/TLS sessions instead of handshaking per request.
+# read_timeout is left at botocore's default — long converse generations can
+# legitimately take longer than any aggressive override
+_http_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+)
+
 class BedrockClient:
     def __init__(self):
         # Set the API key from environment config
@@ -18,11 +28,11 @@ class BedrockClient:
 
         # Bedrock runtime for invoke_model and converse
         self.client = boto3.client(
-            service_name="bedrock-runtime", region_name=AWS_BEDROCK_REGION
+            service_name="bedrock-runtime", region_name=AWS_BEDROCK_REGION, config=_http_config
         )
 
         # Bedrock management operations (e.g., list models)
-        self.bedrock = boto3.client(service_name="bedrock", region_name=AWS_BEDROCK_REGION)
+        self.bedrock = boto3.client(service_name="bedrock", region_name=AWS_BEDROCK_REGION, config=_http_config)
 
     def list_foundation_models(self):
         """List all available foundation models"""
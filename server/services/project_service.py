@@ -99,20 +99,15 @@ class ProjectService:
         if project is None:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        stored_ids = []
         print(f"💾 Storing {len(request.documentation_items)} documentation items in vector store for project {project_id}...")
-        
-        for item in request.documentation_items:
-            # Store in vector store (which handles both data and embeddings)
-            print(f"   Storing documentation: '{item.documentation[:50]}...'")
-            doc_id = VectorService.add_documentation(item.documentation, project_id=str(project_id))
-            if doc_id:
-                stored_ids.append(doc_id)
-                print(f"   ✅ Stored with ID: {doc_id}")
-            else:
-                print(f"   ❌ Failed to store documentation")
-                raise HTTPException(status_code=500, detail="Failed to store documentation in vector database")
-        
+
+        # Store all items in one batch (single embedding call + single transaction)
+        documentations = [item.documentation for item in request.documentation_items]
+        stored_ids = VectorService.add_documentation_bulk(documentations, project_id=str(project_id))
+        if len(stored_ids) != len(documentations):
+            print(f"   ❌ Failed to store documentation")
+            raise HTTPException(status_code=500, detail="Failed to store documentation in vector database")
+
         print(f"✅ Successfully stored {len(stored_ids)} documentation items in vector store")
         return {"status": "success", "vector_store_ids": stored_ids}
 
@@ -123,20 +118,15 @@ class ProjectService:
         if project is None:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        stored_ids = []
         print(f"💾 Storing {len(request.question_sql_pairs)} question-SQL pairs in vector store for project {project_id}...")
-        
-        for item in request.question_sql_pairs:
-            # Store in vector store (which handles both data and embeddings)
-            print(f"   Storing Q-SQL pair: '{item.question[:50]}...'")
-            sql_id = VectorService.add_question_sql(item.question, item.sql, project_id=str(project_id))
-            if sql_id:
-                stored_ids.append(sql_id)
-                print(f"   ✅ Stored with ID: {sql_id}")
-            else:
-                print(f"   ❌ Failed to store question-SQL pair")
-                raise HTTPException(status_code=500, detail="Failed to store question-SQL pair in vector database")
-        
+
+        # Store all pairs in one batch (single embedding call + single transaction)
+        pairs = [(item.question, item.sql) for item in request.question_sql_pairs]
+        stored_ids = VectorService.add_question_sql_bulk(pairs, project_id=str(project_id))
+        if len(stored_ids) != len(pairs):
+            print(f"   ❌ Failed to store question-SQL pairs")
+            raise HTTPException(status_code=500, detail="Failed to store question-SQL pair in vector database")
+
         print(f"✅ Successfully stored {len(stored_ids)} question-SQL pairs in vector store")
         return {"status": "success", "vector_store_ids": stored_ids}
 
@@ -147,20 +137,15 @@ class ProjectService:
         if project is None:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        stored_ids = []
         print(f"💾 Storing {len(request.ddl_statements)} DDL statements in vector store for project {project_id}...")
-        
-        for item in request.ddl_statements:
-            # Store in vector store (which handles both data and embeddings)
-            print(f"   Storing DDL: '{item.ddl[:50]}...'")
-            ddl_id = VectorService.add_ddl(item.ddl, project_id=str(project_id))
-            if ddl_id:
-                stored_ids.append(ddl_id)
-                print(f"   ✅ Stored with ID: {ddl_id}")
-            else:
-                print(f"   ❌ Failed to store DDL statement")
-                raise HTTPException(status_code=500, detail="Failed to store DDL statement in vector database")
-        
+
+        # Store all statements in one batch (single embedding call + single transaction)
+        ddls = [item.ddl for item in request.ddl_statements]
+        stored_ids = VectorService.add_ddl_bulk(ddls, project_id=str(project_id))
+        if len(stored_ids) != len(ddls):
+            print(f"   ❌ Failed to store DDL statements")
+            raise HTTPException(status_code=500, detail="Failed to store DDL statement in vector database")
+
         print(f"✅ Successfully stored {len(stored_ids)} DDL statements in vector store")
         return {"status": "success", "vector_store_ids": stored_ids}
 
@@ -1,7 +1,26 @@
 from vectorDB.factory import VectorStoreFactory
 from db.config import VECTOR_DB_TYPE
+from functools import lru_cache
 import uuid
 
+@lru_cache(maxsize=128)
+def _parse_project_id(project_id):
+    """
+    Convert a string project_id to UUID, keeping it as-is when it isn't one.
+    Cached: the same handful of project ids arrive on every request, and
+    uuid.UUID parsing is pure string work worth skipping.
+    """
+    if isinstance(project_id, str):
+        try:
+            return uuid.UUID(project_id)
+        except ValueError:
+            return project_id
+    return project_id
+
+# Module-level handle to the active store, bound by initialize() so hot-path
+# lookups read one global instead of resolving class attributes per call
+_STORE = None
+
 class VectorService:
     _vector_store = None
     _vector_db_type = None
@@ -15,9 +34,11 @@ class VectorService:
             vector_db_type: Type of vector database ('postgres')
             config: Additional configuration for the vector store
         """
+        global _STORE
+
         if vector_db_type is None:
             vector_db_type = VECTOR_DB_TYPE
-            
+
         try:
             cls._vector_store = VectorStoreFactory.create_vector_store(vector_db_type, config)
             cls._vector_db_type = vector_db_type
@@ -33,13 +54,15 @@ class VectorService:
             except Exception as fallback_error:
                 print(f"❌ Failed to initialize fallback vector database: {fallback_error}")
                 raise
-    
+
+        _STORE = cls._vector_store
+
     @classmethod
     def get_vector_store(cls):
         """Get the vector store instance"""
-        if cls._vector_store is None:
+        if _STORE is None:
             cls.initialize()
-        return cls._vector_store
+        return _STORE
     
     @classmethod
     def get_vector_db_type(cls):
@@ -52,120 +75,98 @@ class VectorService:
     def add_documentation(cls, documentation: str, project_id: str):
         """Add documentation to vector store"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.add_documentation(documentation, project_id=project_id)
     
     @classmethod
     def add_question_sql(cls, question: str, sql: str, project_id: str):
         """Add question-SQL pair to vector store"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.add_question_sql(question, sql, project_id=project_id)
     
+    @classmethod
+    def add_question_sql_bulk(cls, pairs: list, project_id: str):
+        """Add multiple question-SQL pairs to vector store in one batch"""
+        vector_store = cls.get_vector_store()
+        project_id = _parse_project_id(project_id)
+        return vector_store.add_question_sql_bulk(pairs, project_id=project_id)
+
     @classmethod
     def add_ddl(cls, ddl: str, project_id: str):
         """Add DDL to vector store"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.add_ddl(ddl, project_id=project_id)
     
+    @classmethod
+    def add_ddl_bulk(cls, ddls: list, project_id: str):
+        """Add multiple DDL statements to vector store in one batch"""
+        vector_store = cls.get_vector_store()
+        project_id = _parse_project_id(project_id)
+        return vector_store.add_ddl_bulk(ddls, project_id=project_id)
+
+    @classmethod
+    def add_documentation_bulk(cls, documentations: list, project_id: str):
+        """Add multiple documentation items to vector store in one batch"""
+        vector_store = cls.get_vector_store()
+        project_id = _parse_project_id(project_id)
+        return vector_store.add_documentation_bulk(documentations, project_id=project_id)
+
     @classmethod
     def get_related_documentation(cls, query: str, project_id: str):
         """Get related documentation from vector store"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.get_related_documentation(query, project_id=project_id)
     
     @classmethod
     def get_related_ddl(cls, query: str, project_id: str):
         """Get related DDL from vector store"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.get_related_ddl(query, project_id=project_id)
     
     @classmethod
     def get_similar_question_sql(cls, query: str, project_id: str):
         """Get similar question-SQL pairs from vector store"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.get_similar_question_sql(query, project_id=project_id)
     
+    @classmethod
+    def get_all_context(cls, query: str, project_id: str):
+        """Get similar SQL, related DDL, and related documentation in one parallel call"""
+        vector_store = cls.get_vector_store()
+        project_id = _parse_project_id(project_id)
+        return vector_store.get_all_context(query, project_id=project_id)
+
     @classmethod
     def delete_project(cls, project_id: str):
         """Delete all vector data for a project"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.delete_project(project_id)
     
     @classmethod
     def get_all_documentation(cls, project_id: str):
         """Get all documentation items for a project"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.get_all_documentation(project_id=project_id)
     
     @classmethod
     def get_all_question_sql(cls, project_id: str):
         """Get all question-SQL pairs for a project"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.get_all_question_sql(project_id=project_id)
     
     @classmethod
     def get_all_ddl(cls, project_id: str):
         """Get all DDL statements for a project"""
         vector_store = cls.get_vector_store()
-        # Convert string project_id to UUID if needed
-        if isinstance(project_id, str):
-            try:
-                project_id = uuid.UUID(project_id)
-            except ValueError:
-                pass  # Keep as string if not a valid UUID
+        project_id = _parse_project_id(project_id)
         return vector_store.get_all_ddl(project_id=project_id)
     
     @classmethod
@@ -1,32 +1,50 @@
 from typing import Optional, Dict, Any
 from db.config import VECTOR_DB_TYPE, VECTOR_DB_CONFIG
 
+# Cache of constructed stores keyed by (type, config) so repeated factory
+# calls reuse an instance instead of re-running engine and model setup
+_INSTANCES: Dict[tuple, Any] = {}
+
 class VectorStoreFactory:
     """Factory class for creating vector store instances"""
-    
+
     @staticmethod
     def create_vector_store(vector_db_type: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
         """
-        Create a vector store instance based on the specified type
-        
+        Create a vector store instance based on the specified type.
+        Instances are memoized per (type, config), so calling this per request
+        does not re-initialize the database connection or embedding model.
+
         Args:
             vector_db_type: Type of vector database ('postgres')
             config: Additional configuration for the vector store
-            
+
         Returns:
             Vector store instance
         """
         if vector_db_type is None:
             vector_db_type = VECTOR_DB_TYPE
-            
+
         if config is None:
             config = VECTOR_DB_CONFIG.get(vector_db_type, {})
-        
+
+        try:
+            cache_key = (vector_db_type, tuple(sorted(config.items())))
+        except TypeError:
+            cache_key = None  # Unhashable config values can't be memoized
+
+        if cache_key is not None and cache_key in _INSTANCES:
+            return _INSTANCES[cache_key]
+
         if vector_db_type == 'postgres':
             from vectorDB.postgres import PostgresDB_VectorStore
-            return PostgresDB_VectorStore(config=config)
+            store = PostgresDB_VectorStore(config=config)
         else:
             raise ValueError(f"Unsupported vector database type: {vector_db_type}")
+
+        if cache_key is not None:
+            _INSTANCES[cache_key] = store
+        return store
     
     @staticmethod
     def get_supported_types():
@@ -0,0 +1,54 @@
+from typing import List
+import numpy as np
+
+class OnnxMiniLMEmbedder:
+    """
+    Drop-in embedder running a MiniLM ONNX export through onnxruntime.
+    An int8-quantized export (optimum-cli export onnx --optimize O3
+    --quantize) is typically 3-5x faster than FP32 PyTorch on CPU.
+    Exposes the same embed_query/embed_documents surface as
+    HuggingFaceEmbeddings; onnxruntime and tokenizers are imported lazily so
+    they stay optional dependencies.
+    """
+
+    def __init__(self, model_path: str, tokenizer_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 max_length: int = 256):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self.session = onnxruntime.InferenceSession(
+            model_path, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = Tokenizer.from_pretrained(tokenizer_name)
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.asarray([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.asarray([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+        token_embeddings = self.session.run(None, feeds)[0]
+
+        # Mean pooling over non-padding tokens, then L2 normalization —
+        # the same head sentence-transformers applies to this model
+        mask = attention_mask[:, :, None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled = summed / counts
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return pooled / norms
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of documents"""
+        return self._encode(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query string"""
+        return self._encode([text])[0].tolist()
@@ -1,29 +1,38 @@
 from typing import Union
 import hashlib
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 def deterministic_uuid(data: Union[str, bytes]) -> str:
     """
-    Generate a deterministic UUID based on input data using SHA-256.
-    
+    Generate a deterministic UUID based on input data using BLAKE3
+    (SIMD-accelerated, several times faster than SHA-256), falling back to
+    SHA-256 when blake3 is not installed.
+
     Args:
         data (Union[str, bytes]): Input string or bytes to generate UUID from
-        
+
     Returns:
-        str: A deterministic UUID-like string (first 32 chars of SHA-256 hex)
-        
+        str: A deterministic UUID-like string (32 hex chars of the digest)
+
     Raises:
         ValueError: If data is empty or None
         TypeError: If data is not a string or bytes
     """
     if not data:
         raise ValueError("Input data cannot be empty or None")
-        
+
     if not isinstance(data, (str, bytes)):
         raise TypeError("Input data must be a string or bytes")
-    
+
     try:
         if isinstance(data, str):
             data = data.encode()
+        if blake3 is not None:
+            return blake3.blake3(data).hexdigest(length=16)
         return hashlib.sha256(data).hexdigest()[:32]
     except Exception as e:
-        raise RuntimeError(f"Failed to generate UUID: {str(e)}") from e
\ No newline at end of file
+        raise RuntimeError(f"Failed to generate UUID: {str(e)}") from e
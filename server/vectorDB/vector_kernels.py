@@ -0,0 +1,32 @@
+import numpy as np
+
+# Optional numba-compiled scoring kernel for the exact-scan fallback. The
+# compiled loop fuses scoring and selection without intermediate arrays and
+# parallelizes across rows; pure numpy remains the path when numba is absent.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def topk_dot(matrix, query, k):
+        """
+        Return the indices of the k rows of matrix with the highest dot
+        product against query, best first. Rows are expected to be
+        L2-normalized so the dot product is the cosine similarity.
+        """
+        n = matrix.shape[0]
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            acc = np.float32(0.0)
+            for j in range(matrix.shape[1]):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+        order = np.argsort(-scores)
+        if k < n:
+            return order[:k]
+        return order
+else:
+    topk_dot = None